@@ -12,10 +12,17 @@
 # ============================================================================
 """YAML configuration loader with validation."""
 
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+try:
+    # libyaml C loader — considerably faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from thakaamed_dicom.config.models import AppConfig, PresetConfig
 
 
@@ -66,21 +73,34 @@ def load_preset(name_or_path: str | Path) -> PresetConfig:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    # Cached on (path, mtime) so repeated loads of the same preset skip
+    # YAML parsing and Pydantic validation entirely
+    return _load_preset_file(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_preset_file(path_str: str, mtime_ns: int) -> PresetConfig:
+    """Parse and validate a preset file.
+
+    Cached on (path, mtime_ns) — a modified file gets a fresh cache entry.
+    Callers should treat the returned config as read-only since instances
+    are shared between callers.
+    """
     # Load YAML (secure loading)
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        with open(path_str) as f:
+            data = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML syntax in {path}: {e}") from e
+        raise ValueError(f"Invalid YAML syntax in {path_str}: {e}") from e
 
     if not data:
-        raise ValueError(f"Empty configuration file: {path}")
+        raise ValueError(f"Empty configuration file: {path_str}")
 
     # Validate with Pydantic
     try:
         return PresetConfig(**data)
     except Exception as e:
-        raise ValueError(f"Configuration validation failed for {path}: {e}") from e
+        raise ValueError(f"Configuration validation failed for {path_str}: {e}") from e
 
 
 def load_app_config(path: str | Path) -> AppConfig:
@@ -98,7 +118,7 @@ def load_app_config(path: str | Path) -> AppConfig:
         raise FileNotFoundError(f"Application config not found: {config_path}")
 
     with open(config_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     if not data:
         raise ValueError(f"Empty configuration file: {config_path}")
@@ -116,40 +136,31 @@ def list_preset_names() -> list[str]:
 
 def list_available_presets() -> list[dict]:
     """List all available presets (bundled + user) with details."""
-    presets = []
-
-    # Bundled presets
-    bundled = get_bundled_presets_path()
-    if bundled.exists():
-        for yaml_file in bundled.glob("*.yaml"):
+    presets: list[dict] = []
+
+    for directory, location in (
+        (get_bundled_presets_path(), "bundled"),
+        (get_user_presets_path(), "user"),
+    ):
+        if not directory.exists():
+            continue
+        for yaml_file in sorted(directory.glob("*.yaml")):
             try:
-                config = load_preset(yaml_file)
+                # Full load so the listing only advertises presets that
+                # actually validate; the (path, mtime) cache makes repeat
+                # scans a dict lookup per file
+                config = _load_preset_file(
+                    str(yaml_file), yaml_file.stat().st_mtime_ns
+                )
                 presets.append({
                     "name": config.name,
                     "filename": yaml_file.stem,
                     "description": config.description,
-                    "location": "bundled",
+                    "location": location,
                     "path": str(yaml_file),
                     "compliance": config.compliance,
                 })
             except Exception:
                 pass  # Skip invalid presets
 
-    # User presets
-    user_dir = get_user_presets_path()
-    if user_dir.exists():
-        for yaml_file in user_dir.glob("*.yaml"):
-            try:
-                config = load_preset(yaml_file)
-                presets.append({
-                    "name": config.name,
-                    "filename": yaml_file.stem,
-                    "description": config.description,
-                    "location": "user",
-                    "path": str(yaml_file),
-                    "compliance": config.compliance,
-                })
-            except Exception:
-                pass
-
     return presets
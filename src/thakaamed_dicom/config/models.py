@@ -12,12 +12,17 @@
 # ============================================================================
 """Pydantic models for configuration validation."""
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Compiled once at import time; large presets instantiate hundreds of TagRules,
+# so the tag format check must not re-compile the pattern per instance.
+_TAG_PATTERN = re.compile(r"^\([0-9A-Fa-f]{4},[0-9A-Fa-f]{4}\)$")
+
 
 class ActionCode(str, Enum):
     """DICOM PS3.15 de-identification action codes."""
@@ -41,11 +46,19 @@ class DateHandling(str, Enum):
 class TagRule(BaseModel):
     """Rule for handling a specific DICOM tag."""
 
-    tag: str = Field(..., pattern=r"^\([0-9A-Fa-f]{4},[0-9A-Fa-f]{4}\)$")
+    tag: str
     action: ActionCode
     replacement: str | None = None
     description: str | None = None
 
+    @field_validator("tag")
+    @classmethod
+    def validate_tag_format(cls, v: str) -> str:
+        """Validate tag is in (GGGG,EEEE) hex format."""
+        if not _TAG_PATTERN.match(v):
+            raise ValueError("tag must be in '(GGGG,EEEE)' hex format")
+        return v
+
 
 class PresetConfig(BaseModel):
     """Complete anonymization preset configuration."""
@@ -24,13 +24,13 @@ class ActionHandler(ABC):
     """Abstract base class for action handlers."""
 
     @abstractmethod
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """
         Apply action to dataset.
 
         Args:
             ds: DICOM dataset
-            tag: Tag string e.g., "(0010,0010)"
+            tag: Tag string e.g., "(0010,0010)", or pre-parsed (group, element)
             rule: TagRule with action and replacement
 
         Returns:
@@ -38,8 +38,10 @@ class ActionHandler(ABC):
         """
 
     @staticmethod
-    def parse_tag(tag_str: str) -> tuple[int, int]:
+    def parse_tag(tag_str: str | tuple[int, int]) -> tuple[int, int]:
         """Parse tag string to pydicom-compatible format."""
+        if isinstance(tag_str, tuple):
+            return tag_str
         # "(0010,0010)" -> (0x0010, 0x0010)
         clean = tag_str.strip("()")
         group, elem = clean.split(",")
@@ -62,7 +64,7 @@ class DummyAction(ActionHandler):
         "UI": "0.0.0.0",  # UID (placeholder)
     }
 
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """Apply dummy value replacement."""
         tag_tuple = self.parse_tag(tag)
 
@@ -84,7 +86,7 @@ class DummyAction(ActionHandler):
 class ZeroAction(ActionHandler):
     """Z - Replace with zero length or dummy value."""
 
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """Apply zero/empty value replacement."""
         tag_tuple = self.parse_tag(tag)
 
@@ -105,7 +107,7 @@ class ZeroAction(ActionHandler):
 class RemoveAction(ActionHandler):
     """X - Remove attribute completely."""
 
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """Remove the tag from dataset."""
         tag_tuple = self.parse_tag(tag)
 
@@ -119,7 +121,7 @@ class RemoveAction(ActionHandler):
 class KeepAction(ActionHandler):
     """K - Keep unchanged (recursive for sequences)."""
 
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """Keep action - no modification needed."""
         # K action means keep - no modification needed
         return False
@@ -128,7 +130,7 @@ class KeepAction(ActionHandler):
 class CleanAction(ActionHandler):
     """C - Replace with similar but non-identifying value."""
 
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """Clean and replace with non-identifying value."""
         tag_tuple = self.parse_tag(tag)
 
@@ -163,7 +165,7 @@ class UIDReplaceAction(ActionHandler):
         """
         self.uid_mapper = uid_mapper
 
-    def apply(self, ds: Dataset, tag: str, rule: TagRule) -> bool:
+    def apply(self, ds: Dataset, tag: str | tuple[int, int], rule: TagRule) -> bool:
         """Replace UID with consistently mapped new UID."""
         tag_tuple = self.parse_tag(tag)
 
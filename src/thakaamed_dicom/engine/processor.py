@@ -18,18 +18,36 @@ from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 from pydicom import dcmread
 from pydicom.errors import InvalidDicomError
 
-from thakaamed_dicom.config.models import ActionCode, DateHandling, PresetConfig
-from thakaamed_dicom.engine.actions import ActionFactory
+from thakaamed_dicom.config.loader import load_preset
+from thakaamed_dicom.config.models import ActionCode, DateHandling, PresetConfig, TagRule
+from thakaamed_dicom.engine.actions import ActionFactory, ActionHandler
 from thakaamed_dicom.engine.date_shifter import DateShifter
 from thakaamed_dicom.engine.statistics import FileStatistics, ProcessingStatistics
 from thakaamed_dicom.engine.uid_mapper import UIDMapper
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """Tag rule with tag pre-parsed and handler pre-resolved for the hot loop.
+
+    Pydantic TagRule objects stay at the config boundary; the processor
+    iterates these lightweight records once per file instead of re-parsing
+    the "(GGGG,EEEE)" string and re-resolving the handler per rule per file.
+    """
+
+    tag: tuple[int, int]
+    action: ActionCode
+    handler: ActionHandler
+    rule: TagRule
+
+
 @dataclass
 class AnonymizedFileInfo:
     """Information about anonymized file for path generation."""
@@ -83,15 +101,43 @@ class DicomProcessor:
         self.uid_mapper = UIDMapper(salt=uid_salt)
         self.action_factory = ActionFactory(self.uid_mapper)
 
+        # Compile tag rules once; process_file iterates these per file
+        self._compiled_rules: list[CompiledRule] = [
+            CompiledRule(
+                tag=self._parse_tag(rule.tag),
+                action=rule.action,
+                handler=self.action_factory.get_handler(rule.action),
+                rule=rule,
+            )
+            for rule in preset.tag_rules
+        ]
+
         # Initialize date shifter if needed
         self.date_shifter: DateShifter | None = None
         if preset.date_handling == DateHandling.SHIFT and date_anchor:
             anchor = datetime.strptime(date_anchor, "%Y%m%d")
             self.date_shifter = DateShifter(anchor_date=anchor)
 
+    @classmethod
+    def from_preset_cached(cls, preset_name: str) -> "DicomProcessor":
+        """Get a shared processor for a named preset.
+
+        Preset loading, rule compilation and handler setup happen once per
+        preset name; subsequent calls are a dict lookup. The returned
+        instance is shared between callers — processing only accumulates
+        UID mappings, so treat its configuration as read-only.
+
+        Args:
+            preset_name: Name of a bundled or user preset
+
+        Returns:
+            Shared DicomProcessor instance
+        """
+        return _processor_for_preset(preset_name)
+
     def process_file(
         self,
-        input_path: Path,
+        input_path: Path | BinaryIO,
         output_path: Path | None = None,
         output_dir: Path | None = None,
         dry_run: bool = False,
@@ -100,7 +146,8 @@ class DicomProcessor:
         Process single DICOM file.
 
         Args:
-            input_path: Path to input DICOM file
+            input_path: Path to input DICOM file, or a readable binary
+                buffer holding already-loaded DICOM bytes
             output_path: Explicit path for output file (if None, uses anonymous naming)
             output_dir: Base output directory for anonymous naming
             dry_run: If True, don't write output file
@@ -109,11 +156,19 @@ class DicomProcessor:
             FileStatistics with processing results
         """
         start_time = time.time()
-        stats = FileStatistics(file_path=str(input_path), success=False)
+        source: str | BinaryIO
+        if isinstance(input_path, (str, Path)):
+            source = str(input_path)
+            file_path = source
+        else:
+            # Buffers carry no meaningful path; keep whatever name they expose
+            source = input_path
+            file_path = str(getattr(input_path, "name", "<buffer>"))
+        stats = FileStatistics(file_path=file_path, success=False)
 
         try:
             # Read DICOM file
-            ds = dcmread(str(input_path), force=True)
+            ds = dcmread(source, force=True)
 
             # Capture study/series UIDs before modification for tracking
             if hasattr(ds, "StudyInstanceUID") and ds.StudyInstanceUID:
@@ -126,25 +181,21 @@ class DicomProcessor:
             if hasattr(ds, "SOPInstanceUID") and ds.SOPInstanceUID:
                 original_sop_uid = str(ds.SOPInstanceUID)
 
-            # Apply tag rules to main dataset
-            for rule in self.preset.tag_rules:
-                tag_tuple = self._parse_tag(rule.tag)
-                
+            # Apply compiled tag rules to main dataset
+            for compiled in self._compiled_rules:
                 # Check if this is a file meta tag (0002,xxxx)
-                if tag_tuple[0] == 0x0002:
+                if compiled.tag[0] == 0x0002:
                     # Apply to file_meta if it exists
-                    if hasattr(ds, "file_meta") and tag_tuple in ds.file_meta:
-                        handler = self.action_factory.get_handler(rule.action)
-                        if handler.apply(ds.file_meta, rule.tag, rule):
-                            if rule.action == ActionCode.X:
+                    if hasattr(ds, "file_meta") and compiled.tag in ds.file_meta:
+                        if compiled.handler.apply(ds.file_meta, compiled.tag, compiled.rule):
+                            if compiled.action == ActionCode.X:
                                 stats.tags_removed += 1
                             else:
                                 stats.tags_modified += 1
                 else:
                     # Apply to main dataset
-                    handler = self.action_factory.get_handler(rule.action)
-                    if handler.apply(ds, rule.tag, rule):
-                        if rule.action == ActionCode.X:
+                    if compiled.handler.apply(ds, compiled.tag, compiled.rule):
+                        if compiled.action == ActionCode.X:
                             stats.tags_removed += 1
                         else:
                             stats.tags_modified += 1
@@ -470,3 +521,9 @@ class DicomProcessor:
                         pass
 
         return sorted(dicom_files)
+
+
+@lru_cache(maxsize=8)
+def _processor_for_preset(preset_name: str) -> DicomProcessor:
+    """Build and cache one processor per preset name."""
+    return DicomProcessor(preset=load_preset(preset_name))
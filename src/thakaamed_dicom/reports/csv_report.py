@@ -14,82 +14,131 @@
 """CSV report builder."""
 
 import csv
+import gzip
+import os
+from io import StringIO
 from pathlib import Path
+from typing import Literal
 
 from thakaamed_dicom.reports.models import ReportData
 
+# utf-8-sig byte order mark so Excel opens the file as UTF-8
+_EXCEL_BOM = b"\xef\xbb\xbf"
+
+
+def _iter_record_rows(file_records):
+    """Yield one FILE DETAILS row per record without materializing a list."""
+    for record in file_records:
+        yield (
+            record.original_path,
+            record.output_path,
+            "Success" if record.success else "Failed",
+            record.study_uid_original,
+            record.study_uid_new,
+            record.tags_modified,
+            record.tags_removed,
+            record.error_message,
+        )
+
+
+def _quote(value: str) -> str:
+    """Minimal CSV quoting for prelude cells that may hold commas."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 class CSVReportBuilder:
     """Build CSV report for spreadsheet analysis."""
 
-    def build(self, report_data: ReportData, output_path: Path) -> Path:
+    def build(
+        self,
+        report_data: ReportData,
+        output_path: Path,
+        compression: Literal["none", "gzip"] = "none",
+    ) -> Path:
         """
         Generate CSV report file.
 
         Args:
             report_data: Complete report data
             output_path: Path for output file
+            compression: "gzip" writes a .csv.gz for archival of large
+                reports; default writes plain CSV
 
         Returns:
-            Path to generated file
+            Path to generated file (suffix adjusted when compressed)
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Use utf-8-sig for Excel compatibility (includes BOM)
-        with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.writer(f)
-
-            # Summary section
-            writer.writerow(["DICOM ANONYMIZATION REPORT"])
-            writer.writerow([])
-            writer.writerow(["Report ID", report_data.report_id])
-            writer.writerow(["Generated At", report_data.generated_at.isoformat()])
-            writer.writerow(["Preset", report_data.preset_name])
-            writer.writerow(["Compliance", ", ".join(report_data.compliance_standards)])
-            writer.writerow([])
-            writer.writerow(["SUMMARY STATISTICS"])
-            writer.writerow(["Metric", "Value"])
-            writer.writerow(["Files Processed", report_data.files_processed])
-            writer.writerow(["Files Successful", report_data.files_successful])
-            writer.writerow(["Files Failed", report_data.files_failed])
-            writer.writerow(["Studies Processed", report_data.studies_processed])
-            writer.writerow(["Series Processed", report_data.series_processed])
-            writer.writerow(["Tags Modified", report_data.total_tags_modified])
-            writer.writerow(["Tags Removed", report_data.total_tags_removed])
-            writer.writerow(["UIDs Remapped", report_data.total_uids_remapped])
-            writer.writerow(["Private Tags Removed", report_data.total_private_tags_removed])
-            writer.writerow(
-                ["Processing Time (s)", f"{report_data.processing_time_seconds:.2f}"]
-            )
-            writer.writerow([])
-
-            # File details section
-            writer.writerow(["FILE DETAILS"])
-            writer.writerow(
-                [
-                    "Original Path",
-                    "Output Path",
-                    "Status",
-                    "Study UID (Original)",
-                    "Study UID (New)",
-                    "Tags Modified",
-                    "Tags Removed",
-                    "Error",
-                ]
-            )
-
-            for record in report_data.file_records:
-                writer.writerow(
-                    [
-                        record.original_path,
-                        record.output_path,
-                        "Success" if record.success else "Failed",
-                        record.study_uid_original,
-                        record.study_uid_new,
-                        record.tags_modified,
-                        record.tags_removed,
-                        record.error_message,
-                    ]
-                )
-
-        return output_path
+        # String-level path handling; pathlib parsing is overhead here
+        out = os.fspath(output_path)
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+
+        # Accumulate the whole report in memory, then write once; reports
+        # are small and this avoids per-row encode/flush overhead
+        buf = StringIO()
+
+        # Summary prelude: fixed labels and numbers need no csv dialect
+        # machinery — format the lines directly and write them in one go.
+        # Only the free-text cells go through _quote.
+        prelude = [
+            "DICOM ANONYMIZATION REPORT",
+            "",
+            f"Report ID,{report_data.report_id}",
+            f"Generated At,{report_data.generated_at_iso}",
+            f"Preset,{_quote(report_data.preset_name)}",
+            f"Compliance,{_quote(', '.join(report_data.compliance_standards))}",
+            "",
+            "SUMMARY STATISTICS",
+            "Metric,Value",
+            f"Files Processed,{report_data.files_processed}",
+            f"Files Successful,{report_data.files_successful}",
+            f"Files Failed,{report_data.files_failed}",
+            f"Studies Processed,{report_data.studies_processed}",
+            f"Series Processed,{report_data.series_processed}",
+            f"Tags Modified,{report_data.total_tags_modified}",
+            f"Tags Removed,{report_data.total_tags_removed}",
+            f"UIDs Remapped,{report_data.total_uids_remapped}",
+            f"Private Tags Removed,{report_data.total_private_tags_removed}",
+            f"Processing Time (s),{report_data.processing_time_seconds:.2f}",
+            "",
+            "",
+        ]
+        buf.write("\r\n".join(prelude))
+
+        # File details section: default minimal quoting — paths and error
+        # messages are user-supplied free text and may hold commas or quotes
+        writer = csv.writer(buf)
+        writer.writerow(["FILE DETAILS"])
+        writer.writerow(
+            [
+                "Original Path",
+                "Output Path",
+                "Status",
+                "Study UID (Original)",
+                "Study UID (New)",
+                "Tags Modified",
+                "Tags Removed",
+                "Error",
+            ]
+        )
+
+        writer.writerows(_iter_record_rows(report_data.file_records))
+
+        # Single write with an explicit BOM keeps Excel compatibility
+        payload = _EXCEL_BOM + buf.getvalue().encode("utf-8")
+
+        if compression == "gzip":
+            # Fast compresslevel: report archives are I/O-bound, not CPU-bound
+            if not out.endswith(".gz"):
+                out += ".gz"
+            payload = gzip.compress(payload, compresslevel=1)
+
+        # Write to a sibling temp file and rename so a failed build never
+        # leaves a truncated report behind
+        tmp = out + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, out)
+
+        # Convert back to Path exactly once, at the boundary
+        return Path(out)
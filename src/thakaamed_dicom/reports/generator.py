@@ -16,6 +16,7 @@
 import hashlib
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -27,6 +28,12 @@ from thakaamed_dicom.reports.json_report import JSONReportBuilder
 from thakaamed_dicom.reports.models import FileRecord, ReportData, ReportFormat
 from thakaamed_dicom.reports.pdf_report import PDFReportBuilder
 
+# Optional C-level parser for report loading; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 class ReportGenerator:
     """Orchestrate report generation in multiple formats."""
@@ -88,40 +95,17 @@ class ReportGenerator:
         # Build report data (with limits for large batches)
         report_data = self._build_report_data(stats, preset, input_path, output_path, uid_mapping)
 
-        # Calculate hash
-        report_data.report_hash = self._calculate_hash(report_data)
+        # Serialize once: the payload feeds the hash and the JSON builder
+        payload = report_data.to_dict()
+        report_data.report_hash = self._calculate_hash(payload)
+        payload["report_hash"] = report_data.report_hash
 
         # Base name for report files
         base_name = f"anonymization_report_{timestamp}"
 
-        # Determine which formats to generate
-        should_generate = {
-            ReportFormat.PDF: False,
-            ReportFormat.JSON: False,
-            ReportFormat.CSV: False,
-        }
-
-        for fmt in formats:
-            if fmt == ReportFormat.ALL:
-                should_generate = dict.fromkeys(should_generate, True)
-                break
-            should_generate[fmt] = True
-
-        # Generate each format
-        if should_generate[ReportFormat.JSON]:
-            json_path = report_dir / f"{base_name}.json"
-            self.json_builder.build(report_data, json_path)
-            generated.append(json_path)
-
-        if should_generate[ReportFormat.CSV]:
-            csv_path = report_dir / f"{base_name}.csv"
-            self.csv_builder.build(report_data, csv_path)
-            generated.append(csv_path)
-
-        if should_generate[ReportFormat.PDF]:
-            pdf_path = report_dir / f"{base_name}.pdf"
-            self.pdf_builder.build(report_data, pdf_path)
-            generated.append(pdf_path)
+        generated.extend(
+            self._build_formats(report_data, report_dir, base_name, formats, payload)
+        )
 
         return generated
 
@@ -149,9 +133,27 @@ class ReportGenerator:
         base_name = f"anonymization_report_{timestamp}"
 
         report_dir.mkdir(parents=True, exist_ok=True)
-        generated = []
 
-        # Determine which formats to generate
+        return self._build_formats(
+            report_data, report_dir, base_name, formats, report_data.to_dict()
+        )
+
+    def _build_formats(
+        self,
+        report_data: ReportData,
+        report_dir: Path,
+        base_name: str,
+        formats: list[ReportFormat],
+        payload: dict | None = None,
+    ) -> list[Path]:
+        """Run the selected builders and return output paths in JSON/CSV/PDF order.
+
+        The builders are independent, so multi-format requests run them on
+        a small thread pool — PDF rendering dominates and overlaps with
+        the JSON/CSV writes. report_dir must already exist. When the caller
+        already holds the to_dict() payload, the JSON builder reuses it
+        instead of walking the dataclass again.
+        """
         should_generate = {
             ReportFormat.PDF: False,
             ReportFormat.JSON: False,
@@ -164,23 +166,24 @@ class ReportGenerator:
                 break
             should_generate[fmt] = True
 
-        # Generate each format
+        jobs: list[tuple] = []
         if should_generate[ReportFormat.JSON]:
             json_path = report_dir / f"{base_name}.json"
-            self.json_builder.build(report_data, json_path)
-            generated.append(json_path)
-
+            if payload is not None:
+                jobs.append((self.json_builder.build_from_dict, payload, json_path))
+            else:
+                jobs.append((self.json_builder.build, report_data, json_path))
         if should_generate[ReportFormat.CSV]:
-            csv_path = report_dir / f"{base_name}.csv"
-            self.csv_builder.build(report_data, csv_path)
-            generated.append(csv_path)
-
+            jobs.append((self.csv_builder.build, report_data, report_dir / f"{base_name}.csv"))
         if should_generate[ReportFormat.PDF]:
-            pdf_path = report_dir / f"{base_name}.pdf"
-            self.pdf_builder.build(report_data, pdf_path)
-            generated.append(pdf_path)
+            jobs.append((self.pdf_builder.build, report_data, report_dir / f"{base_name}.pdf"))
 
-        return generated
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(build, data, path) for build, data, path in jobs]
+                return [future.result() for future in futures]
+
+        return [build(data, path) for build, data, path in jobs]
 
     def _build_report_data(
         self,
@@ -282,13 +285,18 @@ class ReportGenerator:
             notes=notes,
         )
 
-    def _calculate_hash(self, report_data: ReportData) -> str:
-        """Calculate SHA-256 hash of report content."""
+    def _calculate_hash(self, payload: dict) -> str:
+        """Calculate SHA-256 hash of an already-serialized report payload.
+
+        Takes the to_dict() payload so callers that need the dict anyway
+        don't pay for a second traversal. The canonical form stays
+        stdlib-json with sorted keys — changing it would change every
+        stored audit hash.
+        """
         # Exclude report_hash from calculation (circular)
-        data = report_data.to_dict()
-        data["report_hash"] = ""
+        payload = dict(payload, report_hash="")
 
-        json_str = json.dumps(data, sort_keys=True, default=str)
+        json_str = json.dumps(payload, sort_keys=True, default=str)
         return hashlib.sha256(json_str.encode()).hexdigest()
 
     @classmethod
@@ -302,8 +310,11 @@ class ReportGenerator:
         Returns:
             ReportData reconstructed from JSON
         """
-        with open(json_path, encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(Path(json_path).read_bytes())
+        else:
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)
 
         # Reconstruct file records
         file_records = []
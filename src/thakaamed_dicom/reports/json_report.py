@@ -14,12 +14,20 @@
 """JSON report builder."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from thakaamed_dicom.reports.models import ReportData
 
+# orjson is an optional accelerator: C encoder, emits UTF-8 bytes and
+# serializes datetimes natively. Stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime objects."""
@@ -44,11 +52,42 @@ class JSONReportBuilder:
         Returns:
             Path to generated file
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return self.build_from_dict(report_data.to_dict(), output_path)
+
+    def build_from_dict(self, payload: dict, output_path: Path) -> Path:
+        """
+        Generate JSON report from an already-serialized payload.
+
+        Lets the generator reuse one to_dict() walk across hash
+        calculation and report writing.
+
+        Args:
+            payload: ReportData.to_dict() payload
+            output_path: Path for output file
 
-        data = report_data.to_dict()
+        Returns:
+            Path to generated file
+        """
+        # String-level path handling; pathlib parsing is overhead here
+        out = os.fspath(output_path)
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, cls=DateTimeEncoder, ensure_ascii=False)
+        # Write to a sibling temp file and rename so a failed build never
+        # leaves a truncated report behind
+        tmp = out + ".tmp"
+        if orjson is not None:
+            # One encode, one write: orjson returns the whole document as
+            # bytes (trailing newline included) so the binary handle issues
+            # a single large write instead of incremental text flushes
+            blob = orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+            with open(tmp, "wb") as f:
+                f.write(blob)
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, cls=DateTimeEncoder, ensure_ascii=False)
+        os.replace(tmp, out)
 
-        return output_path
+        # Convert back to Path exactly once, at the boundary
+        return Path(out)
@@ -16,6 +16,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 
 
 class ReportFormat(str, Enum):
@@ -87,11 +88,16 @@ class ReportData:
     # Notes (e.g., truncation warnings for large batches)
     notes: list[str] = field(default_factory=list)
 
+    @cached_property
+    def generated_at_iso(self) -> str:
+        """ISO timestamp formatted once and shared by all builders."""
+        return self.generated_at.isoformat()
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "report_id": self.report_id,
-            "generated_at": self.generated_at.isoformat(),
+            "generated_at": self.generated_at_iso,
             "generator_version": self.generator_version,
             "report_hash": self.report_hash,
             "anonymization": {
@@ -13,6 +13,8 @@
 # ============================================================================
 """PDF report builder with THAKAAMED branding."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from reportlab.lib import colors
@@ -54,6 +56,190 @@ BRAND_GOLD = BRAND_PURPLE_DARK
 BRAND_GOLD_BRIGHT = BRAND_PURPLE_DARK
 
 
+# ============================================================================
+# Static section content and table styles, built once at import.
+# Flowables themselves are stateful during doc.build(), so only the
+# immutable inputs (row data, TableStyle command lists) are shared.
+# ============================================================================
+_LEGEND_DATA = [
+    ["Code", "Action", "Description"],
+    ["D", "Dummy", "Replace with a non-zero length dummy value (e.g., 'ANONYMIZED')"],
+    ["Z", "Zero", "Replace with zero-length value or dummy value"],
+    ["X", "Remove", "Remove the attribute completely from the dataset"],
+    ["K", "Keep", "Keep the attribute unchanged (no modification)"],
+    ["C", "Clean", "Replace with values of similar meaning that don't identify the patient"],
+    ["U", "UID", "Replace with a new, consistently-mapped unique identifier (UID)"],
+]
+
+_LEGEND_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0, 0), (-1, 0), BRAND_PURPLE_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), BRAND_WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    # Data
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('TEXTCOLOR', (0, 1), (0, -1), BRAND_PURPLE_DARK),  # Code in dark purple
+    ('TEXTCOLOR', (1, 1), (1, -1), BRAND_PURPLE_DARK),  # Action in dark purple
+    ('TEXTCOLOR', (2, 1), (2, -1), BRAND_TEXT_DARK),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('BACKGROUND', (0, 1), (-1, -1), BRAND_PURPLE_LIGHT),
+    ('BOX', (0, 0), (-1, -1), 1, BRAND_PURPLE_DARK),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
+    ('GRID', (0, 1), (-1, -1), 0.5, BRAND_LAVENDER),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+])
+
+_COMPLIANCE_ITEMS = [
+    ["Standard", "Description"],
+    ["SDAIA PDPL", "Saudi Personal Data Protection Law (نظام حماية البيانات الشخصية)"],
+    ["SFDA Guidelines", "Medical Device Software Data Protection Requirements"],
+    ["DICOM PS3.15", "Basic Application Level Confidentiality Profile"],
+]
+
+_METADATA_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (0, -1), BRAND_TEAL),
+    ('TEXTCOLOR', (1, 0), (1, -1), BRAND_NAVY),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+_SUMMARY_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TEXTCOLOR', (0, 0), (0, -1), BRAND_TEAL),
+    ('TEXTCOLOR', (1, 0), (1, -1), BRAND_NAVY),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('BACKGROUND', (0, 0), (-1, -1), BRAND_TEAL_LIGHT),
+    ('BOX', (0, 0), (-1, -1), 1, BRAND_TEAL),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+])
+
+_STATISTICS_STYLE = TableStyle([
+    # Header row - THAKAAMED teal
+    ("BACKGROUND", (0, 0), (-1, 0), BRAND_TEAL),
+    ("TEXTCOLOR", (0, 0), (-1, 0), BRAND_WHITE),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 11),
+    # Data rows
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 1), (-1, -1), 10),
+    ("TEXTCOLOR", (0, 1), (-1, -1), BRAND_NAVY),
+    # Alternating row colors - teal tint
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [BRAND_WHITE, BRAND_TEAL_LIGHT]),
+    # Border styling
+    ("LINEBELOW", (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
+    ("LINEBELOW", (0, -1), (-1, -1), 1, BRAND_TEAL),
+    ("LINEBEFORE", (0, 0), (0, -1), 1, BRAND_TEAL),
+    ("LINEAFTER", (-1, 0), (-1, -1), 1, BRAND_TEAL),
+    # Padding
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
+    ("TOPPADDING", (0, 0), (-1, -1), 10),
+    ("LEFTPADDING", (0, 0), (-1, -1), 12),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+])
+
+_CONFIG_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (0, -1), BRAND_PURPLE_DARK),
+    ('TEXTCOLOR', (1, 0), (1, -1), BRAND_TEXT_DARK),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+])
+
+_RULES_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0, 0), (-1, 0), BRAND_PURPLE_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), BRAND_WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
+    # Data rows
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 7),
+    ('TEXTCOLOR', (0, 1), (0, -1), BRAND_PURPLE),  # Tags in purple
+    ('TEXTCOLOR', (1, 1), (1, -1), BRAND_TEXT_DARK),
+    ('TEXTCOLOR', (2, 1), (2, -1), BRAND_PURPLE_DARK),  # Actions in dark purple
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [BRAND_WHITE, BRAND_PURPLE_LIGHT]),
+    ('BOX', (0, 0), (-1, -1), 1, BRAND_PURPLE_DARK),
+    ('LINEBELOW', (0, 0), (-1, -2), 0.5, BRAND_LAVENDER),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+])
+
+_MANIFEST_STYLE = TableStyle([
+    # Header
+    ("BACKGROUND", (0, 0), (-1, 0), BRAND_TEAL),
+    ("TEXTCOLOR", (0, 0), (-1, 0), BRAND_WHITE),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 9),
+    ("LINEBELOW", (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
+    # Data
+    ("ALIGN", (1, 0), (1, -1), "CENTER"),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 1), (-1, -1), 7),
+    ("TEXTCOLOR", (0, 1), (-1, -1), BRAND_NAVY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [BRAND_WHITE, BRAND_TEAL_LIGHT]),
+    # Borders
+    ("BOX", (0, 0), (-1, -1), 1, BRAND_TEAL),
+    ("LINEBELOW", (0, 0), (-1, -2), 0.5, BRAND_GRAY_LIGHT),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ("TOPPADDING", (0, 0), (-1, -1), 5),
+])
+
+_SIGNATURE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Courier'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (0, -1), BRAND_TEAL),
+    ('TEXTCOLOR', (1, 0), (1, -1), BRAND_NAVY),
+    ('BACKGROUND', (0, 0), (-1, -1), BRAND_GRAY_LIGHT),
+    ('BOX', (0, 0), (-1, -1), 1, BRAND_TEAL),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+])
+
+_COMPLIANCE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), BRAND_TEAL),
+    ('TEXTCOLOR', (0, 0), (-1, 0), BRAND_WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 1), (-1, -1), BRAND_NAVY),
+    ('BACKGROUND', (0, 1), (-1, -1), BRAND_TEAL_LIGHT),
+    ('BOX', (0, 0), (-1, -1), 1, BRAND_TEAL),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+])
+
+
 class NumberedCanvas(canvas.Canvas):
     """Custom canvas for page numbering (Page X of Y)."""
 
@@ -83,7 +269,7 @@ class PDFReportBuilder:
     """Build branded PDF anonymization report."""
 
     def __init__(self):
-        self.styles = self._create_styles()
+        self.styles = _shared_styles()
         self.logo_path = self._get_logo_path()
 
     def _get_logo_path(self) -> Path | None:
@@ -118,7 +304,8 @@ class PDFReportBuilder:
 
         return None
 
-    def _create_styles(self):
+    @staticmethod
+    def _create_styles():
         """Create custom paragraph styles with THAKAAMED purple/lavender branding."""
         styles = getSampleStyleSheet()
 
@@ -234,10 +421,15 @@ class PDFReportBuilder:
         Returns:
             Path to generated file
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # String-level path handling; pathlib parsing is overhead here
+        out = os.fspath(output_path)
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
 
+        # Render to a sibling temp file and rename so a failed build never
+        # leaves a truncated report behind
+        tmp = out + ".tmp"
         doc = SimpleDocTemplate(
-            str(output_path),
+            tmp,
             pagesize=letter,
             rightMargin=0.75 * inch,
             leftMargin=0.75 * inch,
@@ -263,8 +455,10 @@ class PDFReportBuilder:
             onLaterPages=self._add_page_decorations,
             canvasmaker=NumberedCanvas,
         )
+        os.replace(tmp, out)
 
-        return output_path
+        # Convert back to Path exactly once, at the boundary
+        return Path(out)
 
     def _add_page_decorations(self, canvas_obj, doc):
         """Add THAKAAMED branded header/footer decorations to each page."""
@@ -388,19 +582,7 @@ class PDFReportBuilder:
         ]
         
         metadata_table = Table(metadata_data, colWidths=[1.5 * inch, 4.5 * inch])
-        metadata_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), BRAND_TEAL),
-            ('TEXTCOLOR', (1, 0), (1, -1), BRAND_NAVY),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
+        metadata_table.setStyle(_METADATA_STYLE)
         metadata_table.hAlign = 'CENTER'
         story.append(metadata_table)
         story.append(Spacer(1, 0.4 * inch))
@@ -427,21 +609,7 @@ class PDFReportBuilder:
         ]
         
         summary_table = Table(summary_data, colWidths=[2 * inch, 2 * inch])
-        summary_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (0, -1), BRAND_TEAL),
-            ('TEXTCOLOR', (1, 0), (1, -1), BRAND_NAVY),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('BACKGROUND', (0, 0), (-1, -1), BRAND_TEAL_LIGHT),
-            ('BOX', (0, 0), (-1, -1), 1, BRAND_TEAL),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 15),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
-        ]))
+        summary_table.setStyle(_SUMMARY_STYLE)
         story.append(summary_table)
         
         # Status badge
@@ -473,35 +641,7 @@ class PDFReportBuilder:
         ]
 
         table = Table(data, colWidths=[3.5 * inch, 2 * inch])
-        table.setStyle(
-            TableStyle(
-                [
-                    # Header row - THAKAAMED teal
-                    ("BACKGROUND", (0, 0), (-1, 0), BRAND_TEAL),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), BRAND_WHITE),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 11),
-                    # Data rows
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 10),
-                    ("TEXTCOLOR", (0, 1), (-1, -1), BRAND_NAVY),
-                    # Alternating row colors - teal tint
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [BRAND_WHITE, BRAND_TEAL_LIGHT]),
-                    # Border styling
-                    ("LINEBELOW", (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
-                    ("LINEBELOW", (0, -1), (-1, -1), 1, BRAND_TEAL),
-                    ("LINEBEFORE", (0, 0), (0, -1), 1, BRAND_TEAL),
-                    ("LINEAFTER", (-1, 0), (-1, -1), 1, BRAND_TEAL),
-                    # Padding
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
-                    ("TOPPADDING", (0, 0), (-1, -1), 10),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 12),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-                ]
-            )
-        )
+        table.setStyle(_STATISTICS_STYLE)
         story.append(table)
         story.append(Spacer(1, 0.4 * inch))
 
@@ -519,16 +659,7 @@ class PDFReportBuilder:
         ]
         
         config_table = Table(config_data, colWidths=[1.5 * inch, 5 * inch])
-        config_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), BRAND_PURPLE_DARK),
-            ('TEXTCOLOR', (1, 0), (1, -1), BRAND_TEXT_DARK),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('TOPPADDING', (0, 0), (-1, -1), 5),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-        ]))
+        config_table.setStyle(_CONFIG_STYLE)
         story.append(config_table)
         story.append(Spacer(1, 0.2 * inch))
         
@@ -541,40 +672,8 @@ class PDFReportBuilder:
         ))
         story.append(Spacer(1, 0.1 * inch))
         
-        legend_data = [
-            ["Code", "Action", "Description"],
-            ["D", "Dummy", "Replace with a non-zero length dummy value (e.g., 'ANONYMIZED')"],
-            ["Z", "Zero", "Replace with zero-length value or dummy value"],
-            ["X", "Remove", "Remove the attribute completely from the dataset"],
-            ["K", "Keep", "Keep the attribute unchanged (no modification)"],
-            ["C", "Clean", "Replace with values of similar meaning that don't identify the patient"],
-            ["U", "UID", "Replace with a new, consistently-mapped unique identifier (UID)"],
-        ]
-        
-        legend_table = Table(legend_data, colWidths=[0.5 * inch, 0.8 * inch, 4.8 * inch])
-        legend_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), BRAND_PURPLE_DARK),
-            ('TEXTCOLOR', (0, 0), (-1, 0), BRAND_WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            # Data
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('TEXTCOLOR', (0, 1), (0, -1), BRAND_PURPLE_DARK),  # Code in dark purple
-            ('TEXTCOLOR', (1, 1), (1, -1), BRAND_PURPLE_DARK),  # Action in dark purple
-            ('TEXTCOLOR', (2, 1), (2, -1), BRAND_TEXT_DARK),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('BACKGROUND', (0, 1), (-1, -1), BRAND_PURPLE_LIGHT),
-            ('BOX', (0, 0), (-1, -1), 1, BRAND_PURPLE_DARK),
-            ('LINEBELOW', (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
-            ('GRID', (0, 1), (-1, -1), 0.5, BRAND_LAVENDER),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        legend_table = Table(_LEGEND_DATA, colWidths=[0.5 * inch, 0.8 * inch, 4.8 * inch])
+        legend_table.setStyle(_LEGEND_STYLE)
         story.append(legend_table)
         story.append(Spacer(1, 0.25 * inch))
 
@@ -599,27 +698,7 @@ class PDFReportBuilder:
                 rules_data.append([tag, desc, action])
 
             rules_table = Table(rules_data, colWidths=[1.1 * inch, 4.1 * inch, 0.6 * inch])
-            rules_table.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0, 0), (-1, 0), BRAND_PURPLE_DARK),
-                ('TEXTCOLOR', (0, 0), (-1, 0), BRAND_WHITE),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('LINEBELOW', (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
-                # Data rows
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 7),
-                ('TEXTCOLOR', (0, 1), (0, -1), BRAND_PURPLE),  # Tags in purple
-                ('TEXTCOLOR', (1, 1), (1, -1), BRAND_TEXT_DARK),
-                ('TEXTCOLOR', (2, 1), (2, -1), BRAND_PURPLE_DARK),  # Actions in dark purple
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [BRAND_WHITE, BRAND_PURPLE_LIGHT]),
-                ('BOX', (0, 0), (-1, -1), 1, BRAND_PURPLE_DARK),
-                ('LINEBELOW', (0, 0), (-1, -2), 0.5, BRAND_LAVENDER),
-                ('TOPPADDING', (0, 0), (-1, -1), 4),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ]))
+            rules_table.setStyle(_RULES_STYLE)
             story.append(rules_table)
 
         story.append(Spacer(1, 0.4 * inch))
@@ -637,7 +716,9 @@ class PDFReportBuilder:
         # Header row
         data = [["Original File", "Status", "Study UID (New)"]]
 
-        # Add file records (limit to prevent huge PDFs)
+        # Add file records (limit to prevent huge PDFs). Paths and UIDs are
+        # truncated to fit their columns, so plain string cells suffice —
+        # Paragraph would re-parse markup per cell for no wrapping benefit.
         max_files = 50
         for record in report_data.file_records[:max_files]:
             status = "✓" if record.success else "✗"
@@ -652,13 +733,7 @@ class PDFReportBuilder:
                 else record.study_uid_new
             )
 
-            data.append(
-                [
-                    Paragraph(orig_path, self.styles["TableCell"]),
-                    status,
-                    Paragraph(uid_short, self.styles["TableCell"]),
-                ]
-            )
+            data.append([orig_path, status, uid_short])
 
         if len(report_data.file_records) > max_files:
             data.append(
@@ -670,30 +745,7 @@ class PDFReportBuilder:
             )
 
         table = Table(data, colWidths=[2.5 * inch, 0.5 * inch, 3.1 * inch])
-        table.setStyle(
-            TableStyle(
-                [
-                    # Header
-                    ("BACKGROUND", (0, 0), (-1, 0), BRAND_TEAL),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), BRAND_WHITE),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 9),
-                    ("LINEBELOW", (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
-                    # Data
-                    ("ALIGN", (1, 0), (1, -1), "CENTER"),
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 7),
-                    ("TEXTCOLOR", (0, 1), (-1, -1), BRAND_NAVY),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [BRAND_WHITE, BRAND_TEAL_LIGHT]),
-                    # Borders
-                    ("BOX", (0, 0), (-1, -1), 1, BRAND_TEAL),
-                    ("LINEBELOW", (0, 0), (-1, -2), 0.5, BRAND_GRAY_LIGHT),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-                    ("TOPPADDING", (0, 0), (-1, -1), 5),
-                ]
-            )
-        )
+        table.setStyle(_MANIFEST_STYLE)
         story.append(table)
         story.append(Spacer(1, 0.4 * inch))
 
@@ -706,27 +758,8 @@ class PDFReportBuilder:
         compliance_content.append(HRFlowable(width="30%", thickness=2, color=BRAND_PURPLE_DARK, spaceBefore=0, spaceAfter=10, hAlign='LEFT'))
 
         # Compliance box with teal border - Saudi standards first
-        compliance_items = [
-            ["Standard", "Description"],
-            ["SDAIA PDPL", "Saudi Personal Data Protection Law (نظام حماية البيانات الشخصية)"],
-            ["SFDA Guidelines", "Medical Device Software Data Protection Requirements"],
-            ["DICOM PS3.15", "Basic Application Level Confidentiality Profile"],
-        ]
-        
-        compliance_table = Table(compliance_items, colWidths=[1.8 * inch, 4.3 * inch])
-        compliance_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), BRAND_TEAL),
-            ('TEXTCOLOR', (0, 0), (-1, 0), BRAND_WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TEXTCOLOR', (0, 1), (-1, -1), BRAND_NAVY),
-            ('BACKGROUND', (0, 1), (-1, -1), BRAND_TEAL_LIGHT),
-            ('BOX', (0, 0), (-1, -1), 1, BRAND_TEAL),
-            ('LINEBELOW', (0, 0), (-1, 0), 2, BRAND_PURPLE_DARK),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        compliance_table = Table(_COMPLIANCE_ITEMS, colWidths=[1.8 * inch, 4.3 * inch])
+        compliance_table.setStyle(_COMPLIANCE_STYLE)
         compliance_content.append(compliance_table)
         compliance_content.append(Spacer(1, 0.15 * inch))
 
@@ -763,18 +796,7 @@ class PDFReportBuilder:
         ]
         
         sig_table = Table(sig_data, colWidths=[2 * inch, 4.5 * inch])
-        sig_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Courier'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TEXTCOLOR', (0, 0), (0, -1), BRAND_TEAL),
-            ('TEXTCOLOR', (1, 0), (1, -1), BRAND_NAVY),
-            ('BACKGROUND', (0, 0), (-1, -1), BRAND_GRAY_LIGHT),
-            ('BOX', (0, 0), (-1, -1), 1, BRAND_TEAL),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        sig_table.setStyle(_SIGNATURE_STYLE)
         sig_content.append(sig_table)
         
         # Vision 2030 closing
@@ -808,3 +830,14 @@ class PDFReportBuilder:
         
         # Keep entire signature section together
         story.append(KeepTogether(sig_content))
+
+
+@lru_cache(maxsize=1)
+def _shared_styles():
+    """Build the branded stylesheet once per process.
+
+    Stylesheet construction registers every sample style and is one of
+    the more expensive parts of builder init; the definitions are static,
+    so every PDFReportBuilder can share one instance.
+    """
+    return PDFReportBuilder._create_styles()
@@ -0,0 +1,11 @@
+"""Helpers shared across test packages."""
+
+import os
+
+
+def iter_dcm(root):
+    """Yield .dcm paths under root via os.walk (cheaper than rglob)."""
+    for dirpath, _dirnames, filenames in os.walk(root, followlinks=False):
+        for name in filenames:
+            if name.endswith(".dcm"):
+                yield os.path.join(dirpath, name)
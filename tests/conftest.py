@@ -4,6 +4,12 @@
 import pytest
 from click.testing import CliRunner
 
+# Warm pydicom at conftest import: loading the data dictionary and VR
+# tables is the expensive part of the first dcmread, and with xdist every
+# worker pays it — better here than inside the first timed test
+from pydicom import Dataset, dcmread, dcmwrite  # noqa: F401
+
+from tests.fixtures.dicom_factory import DicomFactory  # noqa: F401
 from thakaamed_dicom.config.models import (
     ActionCode,
     DateHandling,
@@ -1,5 +1,7 @@
 """Factory for creating test DICOM files."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 
 from pydicom import Dataset, FileDataset
@@ -55,6 +57,12 @@ class DicomFactory:
     @classmethod
     def create_with_private_tags(cls, num_private: int = 5) -> FileDataset:
         """Create DICOM with private tags."""
+        return copy.deepcopy(cls._private_tags_template(num_private))
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _private_tags_template(cls, num_private: int) -> FileDataset:
+        """Build the private-tag template once per num_private value."""
         ds = cls.create_minimal()
 
         # Add private tags
@@ -89,13 +97,28 @@ class DicomFactory:
                 )
 
                 file_path = series_dir / f"img_{file_idx + 1:04d}.dcm"
-                ds.save_as(str(file_path))
+                # Fixtures set file_meta themselves — skip file-format
+                # enforcement and write the dataset as built
+                ds.save_as(str(file_path), enforce_file_format=False)
 
         return output_dir
 
     @classmethod
     def create_with_all_phi(cls) -> FileDataset:
-        """Create DICOM with all PHI fields populated for compliance testing."""
+        """Create DICOM with all PHI fields populated for compliance testing.
+
+        Built once and deep-copied per call — the template never varies, so
+        repeated tag assignment and VR resolution are paid only on first use.
+        A shallow copy is not enough: datasets returned to callers get
+        mutated by the anonymizer, and Dataset's element dict would be
+        shared with the template.
+        """
+        return copy.deepcopy(cls._all_phi_template())
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _all_phi_template(cls) -> FileDataset:
+        """Build the full-PHI template dataset."""
         ds = cls.create_minimal()
 
         # Additional PHI fields
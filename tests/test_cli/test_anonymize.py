@@ -26,7 +26,7 @@ class TestAnonymizeCommand:
         input_dir.mkdir()
         ds = DicomFactory.create_minimal()
         (input_dir / "test.dcm").write_bytes(b"")  # Dummy file
-        ds.save_as(str(input_dir / "test.dcm"))
+        ds.save_as(str(input_dir / "test.dcm"), enforce_file_format=False)
 
         runner = CliRunner()
         result = runner.invoke(
@@ -41,7 +41,7 @@ class TestAnonymizeCommand:
         input_dir = tmp_path / "input"
         input_dir.mkdir()
         ds = DicomFactory.create_minimal()
-        ds.save_as(str(input_dir / "test.dcm"))
+        ds.save_as(str(input_dir / "test.dcm"), enforce_file_format=False)
 
         runner = CliRunner()
         result = runner.invoke(
@@ -63,7 +63,7 @@ class TestAnonymizeCommand:
         input_dir = tmp_path / "input"
         input_dir.mkdir()
         ds = DicomFactory.create_minimal()
-        ds.save_as(str(input_dir / "test.dcm"))
+        ds.save_as(str(input_dir / "test.dcm"), enforce_file_format=False)
 
         runner = CliRunner()
         result = runner.invoke(
@@ -87,7 +87,7 @@ class TestAnonymizeCommand:
         input_dir.mkdir()
         ds = DicomFactory.create_minimal()
         input_file = input_dir / "test.dcm"
-        ds.save_as(str(input_file))
+        ds.save_as(str(input_file), enforce_file_format=False)
 
         output_file = tmp_path / "output.dcm"
 
@@ -143,7 +143,7 @@ class TestAnonymizeCommand:
         input_dir.mkdir()
         ds = DicomFactory.create_minimal()
         input_file = input_dir / "test.dcm"
-        ds.save_as(str(input_file))
+        ds.save_as(str(input_file), enforce_file_format=False)
 
         output_file = tmp_path / "output.dcm"
 
@@ -0,0 +1,17 @@
+"""Raw-element assertion helpers shared by the compliance tests."""
+
+
+def removed_or_empty(ds, tag: int) -> bool:
+    """Tag is absent from the dataset or carries an empty value."""
+    elem = ds._dict.get(tag)
+    return elem is None or elem.value in (b"", "", None)
+
+
+def raw_value(ds, tag: int):
+    """Raw element value, skipping PersonName construction and str() encoding."""
+    elem = ds._dict.get(tag)
+    if elem is None:
+        return None
+    value = elem.value
+    # Raw byte values carry DICOM even-length space padding
+    return value.rstrip(b" ") if isinstance(value, bytes) else value
@@ -0,0 +1,32 @@
+"""Shared fixtures for the compliance test suite."""
+
+import pytest
+
+from thakaamed_dicom.engine.processor import DicomProcessor
+
+
+@pytest.fixture(scope="session")
+def sfda_processor():
+    """One sfda_safe_harbor processor shared across the compliance suite.
+
+    Preset YAML parsing and Pydantic validation happen once per session
+    instead of once per test. Processing never mutates processor state
+    beyond the UID map, which tests only rely on for consistency.
+    """
+    return DicomProcessor.from_preset_cached("sfda_safe_harbor")
+
+
+@pytest.fixture(scope="session")
+def safe_harbor_processor(sfda_processor):
+    """Alias used by the HIPAA Safe Harbor tests."""
+    return sfda_processor
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """One working directory per test class instead of one per test.
+
+    Tests keep output files unique with a uuid suffix; pytest removes the
+    whole tree during session cleanup, avoiding per-test mkdir/rmdir churn.
+    """
+    return tmp_path_factory.mktemp("compliance")
@@ -1,95 +1,114 @@
 """Tests for DICOM PS3.15 Basic Profile compliance."""
 
+import uuid
+
 import pytest
 from pydicom import dcmread
+from pydicom.filereader import read_file_meta_info
 
 from tests.fixtures.dicom_factory import DicomFactory
-from thakaamed_dicom.config.loader import load_preset
-from thakaamed_dicom.engine.processor import DicomProcessor
+from tests.test_compliance._helpers import raw_value, removed_or_empty
+
+# Integer tags for removal checks — avoids pydicom keyword->tag resolution
+# and DataElement conversion per hasattr call
+_PATIENT_NAME = 0x00100010
+_PATIENT_BIRTH_DATE = 0x00100030
+_INSTITUTION_NAME = 0x00080080
+_REFERRING_PHYSICIAN = 0x00080090
 
 
 class TestDicomPS315Compliance:
     """Tests for DICOM PS3.15 Basic Profile compliance."""
 
-    @pytest.fixture
-    def sfda_processor(self):
-        preset = load_preset("sfda_safe_harbor")
-        return DicomProcessor(preset=preset)
-
-    @pytest.fixture
-    def sample_phi_dicom(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def sample_phi_dicom(self, class_tmp):
         """Create DICOM with PHI fields."""
         ds = DicomFactory.create_with_all_phi()
-        path = tmp_path / "phi_test.dcm"
-        ds.save_as(str(path))
+        path = class_tmp / "phi_test.dcm"
+        ds.save_as(str(path), enforce_file_format=False)
         return path
 
-    @pytest.fixture
-    def sample_dicom_with_private(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def sample_dicom_with_private(self, class_tmp):
         """Create DICOM with private tags."""
         ds = DicomFactory.create_with_private_tags(num_private=10)
-        path = tmp_path / "private.dcm"
-        ds.save_as(str(path))
+        path = class_tmp / f"private_{uuid.uuid4().hex}.dcm"
+        ds.save_as(str(path), enforce_file_format=False)
         return path
 
-    def test_patient_name_handled(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_patient_name_handled(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Patient's Name (0010,0010) is handled per Basic Profile."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(str(output), force=True, specific_tags=["PatientName"])
 
         # Should be empty or dummy (Z action)
-        assert str(ds.PatientName) in ("", "ANONYMIZED")
+        assert raw_value(ds, _PATIENT_NAME) in (None, b"", b"ANONYMIZED", "", "ANONYMIZED")
 
-    def test_patient_id_handled(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_patient_id_handled(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Patient ID (0010,0020) is handled per Basic Profile."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(str(output), force=True, specific_tags=["PatientID"])
 
         # Should be empty or different from original
-        original_ds = dcmread(str(sample_phi_dicom), force=True)
+        original_ds = dcmread(str(sample_phi_dicom), force=True, specific_tags=["PatientID"])
         assert ds.PatientID != original_ds.PatientID or ds.PatientID == ""
 
-    def test_birth_date_removed(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_birth_date_removed(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Patient's Birth Date (0010,0030) is removed."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(str(output), force=True, specific_tags=["PatientBirthDate"])
 
         # Should be removed or empty (X action)
-        assert not hasattr(ds, "PatientBirthDate") or ds.PatientBirthDate == ""
+        assert removed_or_empty(ds, _PATIENT_BIRTH_DATE)
 
-    def test_uids_remapped(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_uids_remapped(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Study/Series/SOP Instance UIDs are remapped (U action)."""
-        output = tmp_path / "output.dcm"
-        original_ds = dcmread(str(sample_phi_dicom), force=True)
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
+        uid_tags = ["StudyInstanceUID", "SeriesInstanceUID", "SOPInstanceUID"]
+        original_ds = dcmread(str(sample_phi_dicom), force=True, specific_tags=uid_tags)
 
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(str(output), force=True, specific_tags=uid_tags)
 
         # All UIDs should be different and in 2.25 format
         assert ds.StudyInstanceUID != original_ds.StudyInstanceUID
         assert ds.SeriesInstanceUID != original_ds.SeriesInstanceUID
         assert ds.SOPInstanceUID != original_ds.SOPInstanceUID
 
-        assert ds.StudyInstanceUID.startswith("2.25.")
-        assert ds.SeriesInstanceUID.startswith("2.25.")
-        assert ds.SOPInstanceUID.startswith("2.25.")
+        assert all(
+            uid.startswith("2.25.")
+            for uid in (ds.StudyInstanceUID, ds.SeriesInstanceUID, ds.SOPInstanceUID)
+        )
 
-    def test_media_storage_uid_matches_sop(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_media_storage_uid_matches_sop(self, sfda_processor, sample_phi_dicom, class_tmp):
         """MediaStorageSOPInstanceUID matches SOPInstanceUID."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
 
-        assert ds.file_meta.MediaStorageSOPInstanceUID == ds.SOPInstanceUID
+        # Only two UIDs are compared — read the file meta group and the one
+        # body tag instead of parsing the full dataset
+        meta = read_file_meta_info(str(output))
+        ds = dcmread(
+            str(output),
+            force=True,
+            specific_tags=["SOPInstanceUID"],
+            stop_before_pixels=True,
+        )
+
+        assert meta.MediaStorageSOPInstanceUID == ds.SOPInstanceUID
 
-    def test_deidentification_markers_present(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_deidentification_markers_present(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Required de-identification markers are present."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(
+            str(output),
+            force=True,
+            specific_tags=["PatientIdentityRemoved", "DeidentificationMethod"],
+        )
 
         # (0012,0062) Patient Identity Removed must be "YES"
         assert hasattr(ds, "PatientIdentityRemoved")
@@ -100,32 +119,35 @@ class TestDicomPS315Compliance:
         assert ds.DeidentificationMethod != ""
 
     def test_private_tags_removed(
-        self, sfda_processor, sample_dicom_with_private, tmp_path
+        self, sfda_processor, sample_dicom_with_private, class_tmp
     ):
         """All private tags are removed."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_dicom_with_private, output)
         ds = dcmread(str(output), force=True)
 
         private_count = sum(1 for elem in ds if elem.tag.is_private)
         assert private_count == 0
 
-    def test_institution_name_removed(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_institution_name_removed(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Institution Name is handled appropriately."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(str(output), force=True, specific_tags=["InstitutionName"])
 
         # Should be removed or anonymized
-        assert not hasattr(ds, "InstitutionName") or ds.InstitutionName == ""
+        assert removed_or_empty(ds, _INSTITUTION_NAME)
 
-    def test_referring_physician_handled(self, sfda_processor, sample_phi_dicom, tmp_path):
+    def test_referring_physician_handled(self, sfda_processor, sample_phi_dicom, class_tmp):
         """Referring Physician Name is handled."""
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         sfda_processor.process_file(sample_phi_dicom, output)
-        ds = dcmread(str(output), force=True)
+        ds = dcmread(str(output), force=True, specific_tags=["ReferringPhysicianName"])
 
         # Should be empty or anonymized
-        if hasattr(ds, "ReferringPhysicianName"):
-            value = str(ds.ReferringPhysicianName)
-            assert value in ("", "ANONYMIZED", "Dr^Anonymized")
+        raw = raw_value(ds, _REFERRING_PHYSICIAN)
+        assert raw in (
+            None,
+            b"", b"ANONYMIZED", b"Dr^Anonymized",
+            "", "ANONYMIZED", "Dr^Anonymized",
+        )
@@ -1,94 +1,75 @@
 """Tests for HIPAA Safe Harbor compliance (18 identifiers)."""
 
+import uuid
+
 import pytest
 from pydicom import dcmread
 
 from tests.fixtures.dicom_factory import DicomFactory
-from thakaamed_dicom.config.loader import load_preset
-from thakaamed_dicom.engine.processor import DicomProcessor
+from tests.test_compliance._helpers import raw_value, removed_or_empty
+
+# Integer tags for removal checks — avoids pydicom keyword->tag resolution
+# and DataElement conversion per hasattr call
+_PATIENT_NAME = 0x00100010
+_PATIENT_BIRTH_DATE = 0x00100030
+_PATIENT_ADDRESS = 0x00101040
+_INSTITUTION_ADDRESS = 0x00080081
+_PATIENT_PHONE = 0x00102154
+_OTHER_PATIENT_IDS = 0x00101000
+
+# Identifier sweep table: (HIPAA identifier, integer tag) pairs that the
+# Safe Harbor preset must remove or empty
+HIPAA_TAG_TABLE = [
+    ("PatientAddress", _PATIENT_ADDRESS),
+    ("InstitutionAddress", _INSTITUTION_ADDRESS),
+    ("PatientBirthDate", _PATIENT_BIRTH_DATE),
+    ("PatientTelephoneNumbers", _PATIENT_PHONE),
+    ("OtherPatientIDs", _OTHER_PATIENT_IDS),
+]
 
 
 class TestHIPAASafeHarbor:
     """Tests for HIPAA Safe Harbor compliance (18 identifiers)."""
 
-    @pytest.fixture
-    def safe_harbor_processor(self):
-        preset = load_preset("sfda_safe_harbor")
-        return DicomProcessor(preset=preset)
+    @pytest.fixture(scope="class")
+    def processed_ds(self, safe_harbor_processor, tmp_path_factory):
+        """Full-PHI file processed and read back once for the whole class."""
+        work = tmp_path_factory.mktemp("safe_harbor")
+        input_file = work / "full_phi.dcm"
+        DicomFactory.create_with_all_phi().save_as(str(input_file), enforce_file_format=False)
 
-    @pytest.fixture
-    def full_phi_file(self, tmp_path):
-        """Create file with all HIPAA identifiers."""
-        ds = DicomFactory.create_with_all_phi()
-        path = tmp_path / "full_phi.dcm"
-        ds.save_as(str(path))
-        return path
+        output = work / "output.dcm"
+        safe_harbor_processor.process_file(input_file, output)
+        return dcmread(str(output), force=True)
 
-    def test_names_removed(self, safe_harbor_processor, full_phi_file, tmp_path):
+    def test_names_removed(self, processed_ds):
         """All names are removed (Identifier #1)."""
-        output = tmp_path / "output.dcm"
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
-
         # Check patient name
-        assert str(ds.PatientName) in ("", "ANONYMIZED")
-
-    def test_address_removed(self, safe_harbor_processor, full_phi_file, tmp_path):
-        """Geographic information is removed (Identifier #2)."""
-        output = tmp_path / "output.dcm"
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
-
-        assert not hasattr(ds, "PatientAddress") or ds.PatientAddress == ""
-        assert not hasattr(ds, "InstitutionAddress") or ds.InstitutionAddress == ""
-
-    def test_dates_removed(self, safe_harbor_processor, full_phi_file, tmp_path):
-        """Dates are removed (Identifier #3)."""
-        output = tmp_path / "output.dcm"
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
-
-        # Birth date must be removed for Safe Harbor
-        assert not hasattr(ds, "PatientBirthDate") or ds.PatientBirthDate == ""
+        assert raw_value(processed_ds, _PATIENT_NAME) in (
+            None, b"", b"ANONYMIZED", "", "ANONYMIZED"
+        )
 
-    def test_phone_numbers_removed(self, safe_harbor_processor, full_phi_file, tmp_path):
-        """Phone numbers are removed (Identifier #4)."""
-        output = tmp_path / "output.dcm"
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
+    @pytest.mark.parametrize("identifier,tag", HIPAA_TAG_TABLE)
+    def test_identifier_removed(self, processed_ds, identifier, tag):
+        """HIPAA identifier tags are removed or emptied (Identifiers #2-#4)."""
+        assert removed_or_empty(processed_ds, tag), identifier
 
-        assert not hasattr(ds, "PatientTelephoneNumbers") or ds.PatientTelephoneNumbers == ""
-
-    def test_medical_record_numbers_replaced(
-        self, safe_harbor_processor, full_phi_file, tmp_path
-    ):
+    def test_medical_record_numbers_replaced(self, processed_ds):
         """Medical record numbers are replaced (Identifier #6)."""
-        output = tmp_path / "output.dcm"
-        original = dcmread(str(full_phi_file), force=True)
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
-
         # Patient ID typically serves as MRN - should be changed or empty
-        assert ds.PatientID != original.PatientID or ds.PatientID == ""
+        original_id = DicomFactory.create_with_all_phi().PatientID
+        assert processed_ds.PatientID != original_id or processed_ds.PatientID == ""
 
-    def test_other_patient_ids_removed(self, safe_harbor_processor, full_phi_file, tmp_path):
-        """Other patient identifiers are removed."""
-        output = tmp_path / "output.dcm"
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
-
-        assert not hasattr(ds, "OtherPatientIDs") or ds.OtherPatientIDs == ""
-
-    def test_device_identifiers_handled(self, safe_harbor_processor, tmp_path):
+    def test_device_identifiers_handled(self, safe_harbor_processor, class_tmp):
         """Device identifiers and serial numbers are handled."""
         # Create file with device identifiers
         ds = DicomFactory.create_minimal()
         ds.DeviceSerialNumber = "SERIAL123"
         ds.StationName = "CT_SCANNER_01"
-        input_file = tmp_path / "device.dcm"
-        ds.save_as(str(input_file))
+        input_file = class_tmp / f"device_{uuid.uuid4().hex}.dcm"
+        ds.save_as(str(input_file), enforce_file_format=False)
 
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         safe_harbor_processor.process_file(input_file, output)
         result = dcmread(str(output), force=True)
 
@@ -98,32 +79,28 @@ class TestHIPAASafeHarbor:
         assert result is not None
 
     def test_private_tags_removed_safe_harbor(
-        self, safe_harbor_processor, tmp_path
+        self, safe_harbor_processor, class_tmp
     ):
         """Private tags are removed for Safe Harbor compliance."""
         ds = DicomFactory.create_with_private_tags(num_private=5)
-        input_file = tmp_path / "private.dcm"
-        ds.save_as(str(input_file))
+        input_file = class_tmp / f"private_{uuid.uuid4().hex}.dcm"
+        ds.save_as(str(input_file), enforce_file_format=False)
 
-        output = tmp_path / "output.dcm"
+        output = class_tmp / f"output_{uuid.uuid4().hex}.dcm"
         safe_harbor_processor.process_file(input_file, output)
         result = dcmread(str(output), force=True)
 
         private_count = sum(1 for elem in result if elem.tag.is_private)
         assert private_count == 0
 
-    def test_uid_format_valid(self, safe_harbor_processor, full_phi_file, tmp_path):
+    def test_uid_format_valid(self, processed_ds):
         """New UIDs have valid format."""
-        output = tmp_path / "output.dcm"
-        safe_harbor_processor.process_file(full_phi_file, output)
-        ds = dcmread(str(output), force=True)
+        ds = processed_ds
+
+        uids = (ds.StudyInstanceUID, ds.SeriesInstanceUID, ds.SOPInstanceUID)
 
         # UIDs should be in 2.25 format (UUID-based)
-        assert ds.StudyInstanceUID.startswith("2.25.")
-        assert ds.SeriesInstanceUID.startswith("2.25.")
-        assert ds.SOPInstanceUID.startswith("2.25.")
+        assert all(uid.startswith("2.25.") for uid in uids)
 
         # UIDs should be <= 64 characters
-        assert len(ds.StudyInstanceUID) <= 64
-        assert len(ds.SeriesInstanceUID) <= 64
-        assert len(ds.SOPInstanceUID) <= 64
+        assert all(len(uid) <= 64 for uid in uids)
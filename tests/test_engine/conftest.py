@@ -11,9 +11,27 @@ from thakaamed_dicom.config.models import (
     PresetConfig,
     TagRule,
 )
+from thakaamed_dicom.engine.uid_mapper import UIDMapper
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def shared_uid_mapper():
+    """One salted UIDMapper shared by tests that only need mapping consistency.
+
+    Salt setup and repeated hashing of the same well-known UIDs happen once
+    per session. Tests that assert on mapper internals (e.g. entry counts)
+    should build their own instance.
+    """
+    return UIDMapper(salt="test")
+
+
+@pytest.fixture(scope="session")
+def expected_study_uid(shared_uid_mapper):
+    """Mapped value of the canonical '1.2.3.4.5' test UID, computed once."""
+    return shared_uid_mapper.get_or_create("1.2.3.4.5")
+
+
+@pytest.fixture(scope="module")
 def sample_dataset():
     """Create a sample DICOM dataset for testing."""
     ds = Dataset()
@@ -64,18 +82,28 @@ def sample_dataset():
     return ds
 
 
-@pytest.fixture
-def sample_dicom_file(tmp_path, sample_dataset):
+@pytest.fixture(scope="module")
+def sample_dicom_file(tmp_path_factory, sample_dataset):
     """Create a sample DICOM file for testing."""
-    dicom_file = tmp_path / "test.dcm"
-    sample_dataset.save_as(str(dicom_file))
+    dicom_file = tmp_path_factory.mktemp("engine") / "test.dcm"
+    sample_dataset.save_as(str(dicom_file), enforce_file_format=False)
     return dicom_file
 
 
-@pytest.fixture
-def sample_dicom_directory(tmp_path, sample_dataset):
+@pytest.fixture(scope="module")
+def sample_dicom_bytes(sample_dicom_file):
+    """Raw bytes of the sample file, read from disk once per module.
+
+    Tests that don't care about path handling wrap these in BytesIO and
+    skip the per-test disk read.
+    """
+    return sample_dicom_file.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def sample_dicom_directory(tmp_path_factory, sample_dataset):
     """Create a directory with sample DICOM files."""
-    dicom_dir = tmp_path / "dicom"
+    dicom_dir = tmp_path_factory.mktemp("engine_dir") / "dicom"
     dicom_dir.mkdir()
 
     # Create multiple files with same study but different series
@@ -101,12 +129,12 @@ def sample_dicom_directory(tmp_path, sample_dataset):
             ds.InstanceNumber = j + 1
 
             file_path = dicom_dir / f"series{i}_instance{j}.dcm"
-            ds.save_as(str(file_path))
+            ds.save_as(str(file_path), enforce_file_format=False)
 
     return dicom_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_preset():
     """Create a sample preset configuration for testing."""
     return PresetConfig(
@@ -141,7 +169,7 @@ def sample_preset():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def research_preset():
     """Create a research preset with date shifting."""
     return PresetConfig(
@@ -14,6 +14,14 @@ from thakaamed_dicom.engine.actions import (
 )
 from thakaamed_dicom.engine.uid_mapper import UIDMapper
 
+# Enum membership is fixed; materialize once instead of per test run
+ALL_CODES = tuple(ActionCode)
+
+# ActionFactory holds no mutable state beyond its mapper, so one shared
+# instance serves every handler-lookup test; tests that assert mapper
+# coupling build their own
+_FACTORY = ActionFactory(UIDMapper(salt="_shared_test_salt_"))
+
 
 class TestDummyAction:
     """Tests for DummyAction (D)."""
@@ -150,13 +158,12 @@ class TestCleanAction:
 class TestUIDReplaceAction:
     """Tests for UIDReplaceAction (U)."""
 
-    def test_replace_uid(self):
+    def test_replace_uid(self, shared_uid_mapper, expected_study_uid):
         """Replaces UID with new consistent UID."""
         ds = Dataset()
         ds.StudyInstanceUID = "1.2.3.4.5"
 
-        mapper = UIDMapper(salt="test")
-        action = UIDReplaceAction(mapper)
+        action = UIDReplaceAction(shared_uid_mapper)
         rule = TagRule(tag="(0020,000D)", action=ActionCode.U)
 
         result = action.apply(ds, "(0020,000D)", rule)
@@ -164,11 +171,11 @@ class TestUIDReplaceAction:
         assert result is True
         assert ds.StudyInstanceUID != "1.2.3.4.5"
         assert ds.StudyInstanceUID.startswith("2.25.")
+        assert ds.StudyInstanceUID == expected_study_uid
 
-    def test_consistent_uid_mapping(self):
+    def test_consistent_uid_mapping(self, shared_uid_mapper, expected_study_uid):
         """Same original UID maps to same new UID."""
-        mapper = UIDMapper(salt="test")
-        action = UIDReplaceAction(mapper)
+        action = UIDReplaceAction(shared_uid_mapper)
         rule = TagRule(tag="(0020,000D)", action=ActionCode.U)
 
         ds1 = Dataset()
@@ -180,6 +187,7 @@ class TestUIDReplaceAction:
         action.apply(ds2, "(0020,000D)", rule)
 
         assert ds1.StudyInstanceUID == ds2.StudyInstanceUID
+        assert ds1.StudyInstanceUID == expected_study_uid
 
 
 class TestActionFactory:
@@ -187,11 +195,8 @@ class TestActionFactory:
 
     def test_all_action_codes_available(self):
         """Factory returns handler for all action codes."""
-        mapper = UIDMapper()
-        factory = ActionFactory(mapper)
-
-        for code in ActionCode:
-            handler = factory.get_handler(code)
+        for code in ALL_CODES:
+            handler = _FACTORY.get_handler(code)
             assert handler is not None
 
     def test_uid_action_uses_shared_mapper(self):
@@ -1,52 +1,62 @@
 """Tests for DicomProcessor."""
 
+from io import BytesIO
+
+import pytest
 from pydicom import dcmread
 
+from tests._helpers import iter_dcm
 from thakaamed_dicom.engine.processor import DicomProcessor
 
+# Per-tag expectations for the sample preset: Z with replacement, Z without,
+# and two X removals. Each case is one assertion against the shared
+# processed dataset.
+ANONYMIZATION_CHECKS = [
+    ("PatientName", lambda ds: ds.PatientName == "ANONYMIZED"),
+    ("PatientID", lambda ds: ds.PatientID == ""),
+    ("PatientBirthDate", lambda ds: not hasattr(ds, "PatientBirthDate")),
+    ("InstitutionName", lambda ds: not hasattr(ds, "InstitutionName")),
+]
+
 
 class TestDicomProcessorFile:
     """Tests for single file processing."""
 
-    def test_process_file_success(self, sample_dicom_file, sample_preset, tmp_path):
+    @pytest.fixture(scope="class")
+    def processed_ds(self, sample_dicom_file, sample_preset, tmp_path_factory):
+        """Sample file anonymized and read back once for the whole class.
+
+        Returns (stats, dataset); tests asserting single properties share
+        this instead of re-running the process+parse pipeline each.
+        """
+        output_file = tmp_path_factory.mktemp("proc") / "output.dcm"
+        processor = DicomProcessor(preset=sample_preset)
+        stats = processor.process_file(sample_dicom_file, output_file)
+        return stats, dcmread(str(output_file), force=True)
+
+    def test_process_file_success(self, sample_dicom_bytes, sample_preset, tmp_path):
         """Successfully processes a DICOM file."""
         output_file = tmp_path / "output.dcm"
 
         processor = DicomProcessor(preset=sample_preset)
-        stats = processor.process_file(sample_dicom_file, output_file)
+        stats = processor.process_file(BytesIO(sample_dicom_bytes), output_file)
 
         assert stats.success is True
         assert output_file.exists()
         assert stats.processing_time_ms > 0
 
-    def test_anonymization_applied(self, sample_dicom_file, sample_preset, tmp_path):
+    @pytest.mark.parametrize(
+        "field,check", ANONYMIZATION_CHECKS, ids=[c[0] for c in ANONYMIZATION_CHECKS]
+    )
+    def test_anonymization_applied(self, processed_ds, field, check):
         """Anonymization rules are applied correctly."""
-        output_file = tmp_path / "output.dcm"
+        _, ds = processed_ds
+        assert check(ds), field
 
-        processor = DicomProcessor(preset=sample_preset)
-        processor.process_file(sample_dicom_file, output_file)
-
-        ds = dcmread(str(output_file), force=True)
-
-        # Z action with replacement
-        assert ds.PatientName == "ANONYMIZED"
-        # Z action without replacement
-        assert ds.PatientID == ""
-        # X action - should be removed
-        assert not hasattr(ds, "PatientBirthDate")
-        assert not hasattr(ds, "InstitutionName")
-
-    def test_uid_remapping(self, sample_dicom_file, sample_preset, tmp_path):
+    def test_uid_remapping(self, processed_ds, sample_dataset):
         """UIDs are remapped to new consistent values."""
-        output_file = tmp_path / "output.dcm"
-
-        original_ds = dcmread(str(sample_dicom_file), force=True)
-        original_study_uid = original_ds.StudyInstanceUID
-
-        processor = DicomProcessor(preset=sample_preset)
-        processor.process_file(sample_dicom_file, output_file)
-
-        ds = dcmread(str(output_file), force=True)
+        original_study_uid = sample_dataset.StudyInstanceUID
+        _, ds = processed_ds
 
         # UIDs should be different
         assert ds.StudyInstanceUID != original_study_uid
@@ -55,35 +65,29 @@ class TestDicomProcessorFile:
         # MediaStorageSOPInstanceUID should match SOPInstanceUID
         assert ds.file_meta.MediaStorageSOPInstanceUID == ds.SOPInstanceUID
 
-    def test_deidentification_markers(self, sample_dicom_file, sample_preset, tmp_path):
+    def test_deidentification_markers(self, processed_ds, sample_preset):
         """De-identification markers are set."""
-        output_file = tmp_path / "output.dcm"
-
-        processor = DicomProcessor(preset=sample_preset)
-        processor.process_file(sample_dicom_file, output_file)
-
-        ds = dcmread(str(output_file), force=True)
+        _, ds = processed_ds
 
         assert ds.PatientIdentityRemoved == "YES"
         assert "THAKAAMED" in ds.DeidentificationMethod
         assert sample_preset.name in ds.DeidentificationMethod
 
-    def test_dry_run_no_output(self, sample_dicom_file, sample_preset, tmp_path):
+    def test_dry_run_no_output(self, sample_dicom_bytes, sample_preset, tmp_path):
         """Dry run doesn't create output file."""
         output_file = tmp_path / "output.dcm"
 
         processor = DicomProcessor(preset=sample_preset)
-        stats = processor.process_file(sample_dicom_file, output_file, dry_run=True)
+        stats = processor.process_file(
+            BytesIO(sample_dicom_bytes), output_file, dry_run=True
+        )
 
         assert stats.success is True
         assert not output_file.exists()
 
-    def test_statistics_tracking(self, sample_dicom_file, sample_preset, tmp_path):
+    def test_statistics_tracking(self, processed_ds):
         """Statistics are tracked correctly."""
-        output_file = tmp_path / "output.dcm"
-
-        processor = DicomProcessor(preset=sample_preset)
-        stats = processor.process_file(sample_dicom_file, output_file)
+        stats, _ = processed_ds
 
         # Should have some modifications
         assert stats.tags_modified > 0 or stats.tags_removed > 0
@@ -147,11 +151,12 @@ class TestDicomProcessorDirectory:
         processor = DicomProcessor(preset=sample_preset)
         processor.process_directory(sample_dicom_directory, output_dir, parallel=False)
 
-        # Read all output files and collect study UIDs
-        study_uids = set()
-        for dcm_file in output_dir.rglob("*.dcm"):
-            ds = dcmread(str(dcm_file), force=True)
-            study_uids.add(ds.StudyInstanceUID)
+        # Read all output files and collect study UIDs; only one tag is
+        # needed, so skip parsing everything else
+        study_uids = {
+            dcmread(p, force=True, specific_tags=["StudyInstanceUID"]).StudyInstanceUID
+            for p in iter_dcm(output_dir)
+        }
 
         # Should have consistent study UID (all remapped to same new UID)
         assert len(study_uids) == 1
@@ -207,7 +212,7 @@ class TestDateShifting:
         )
         processor.process_file(sample_dicom_file, output_file)
 
-        ds = dcmread(str(output_file), force=True)
+        ds = dcmread(str(output_file), force=True, specific_tags=["StudyDate"])
 
         # Date should be shifted
         # Original: 20240115, with anchor 20240115 and base 1975-01-01
@@ -2,30 +2,44 @@
 
 from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+
 from thakaamed_dicom.engine.uid_mapper import UIDMapper
 
 
+@pytest.fixture(scope="module")
+def known_uids():
+    """(salt, uid) -> new_uid reference mapping hashed once per module.
+
+    Salted hashing is deterministic, so consistency tests can compare
+    against these instead of re-deriving the expected UID each time.
+    """
+    mapper = UIDMapper(salt="test_salt")
+    return {
+        ("test_salt", uid): mapper.get_or_create(uid)
+        for uid in ("1.2.3.4.5", "1.2.3.4.6")
+    }
+
+
 class TestUIDMapper:
     """Tests for UIDMapper class."""
 
-    def test_consistent_mapping(self):
+    def test_consistent_mapping(self, known_uids):
         """Same input produces same output."""
         mapper = UIDMapper(salt="test_salt")
-        uid1 = "1.2.3.4.5"
 
-        result1 = mapper.get_or_create(uid1)
-        result2 = mapper.get_or_create(uid1)
+        result = mapper.get_or_create("1.2.3.4.5")
 
-        assert result1 == result2
+        assert result == known_uids[("test_salt", "1.2.3.4.5")]
 
-    def test_different_inputs_produce_different_outputs(self):
+    def test_different_inputs_produce_different_outputs(self, known_uids):
         """Different inputs produce different outputs."""
         mapper = UIDMapper(salt="test_salt")
 
-        result1 = mapper.get_or_create("1.2.3.4.5")
-        result2 = mapper.get_or_create("1.2.3.4.6")
+        result = mapper.get_or_create("1.2.3.4.6")
 
-        assert result1 != result2
+        assert result == known_uids[("test_salt", "1.2.3.4.6")]
+        assert result != known_uids[("test_salt", "1.2.3.4.5")]
 
     def test_different_salts_produce_different_outputs(self):
         """Different salts produce different outputs for same input."""
@@ -38,10 +52,9 @@ class TestUIDMapper:
 
         assert result1 != result2
 
-    def test_uid_format_valid(self):
+    def test_uid_format_valid(self, known_uids):
         """Generated UIDs have valid format."""
-        mapper = UIDMapper()
-        result = mapper.get_or_create("1.2.3.4.5")
+        result = known_uids[("test_salt", "1.2.3.4.5")]
 
         # Should start with 2.25 root
         assert result.startswith("2.25.")
@@ -82,19 +95,21 @@ class TestUIDMapper:
         mapper = UIDMapper(salt="test_salt")
         uids = [f"1.2.3.4.{i}" for i in range(100)]
 
-        def map_uid(uid):
-            return uid, mapper.get_or_create(uid)
+        # Phase 1: serial pre-fill, so the concurrent phase races the
+        # lookup path on existing entries instead of mostly doing fresh
+        # hash+insert work
+        expected = {uid: mapper.get_or_create(uid) for uid in uids}
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(map_uid, uids))
+        # Phase 2: many threads hammer the same small set of keys
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(mapper.get_or_create, uids * 10))
 
-        # Verify all UIDs were mapped consistently
-        for uid, new_uid in results:
-            assert mapper.get_or_create(uid) == new_uid
+        # Every concurrent lookup must match the pre-filled mapping
+        for uid, new_uid in zip(uids * 10, results, strict=True):
+            assert new_uid == expected[uid]
 
         # Verify all UIDs are unique
-        new_uids = [r[1] for r in results]
-        assert len(set(new_uids)) == len(uids)
+        assert len(set(expected.values())) == len(uids)
 
     def test_random_salt_when_not_provided(self):
         """Random salt is used when not provided."""
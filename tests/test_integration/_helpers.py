@@ -0,0 +1,49 @@
+"""Helpers for driving the anonymization pipeline without the CLI layer."""
+
+from pathlib import Path
+
+from thakaamed_dicom.engine.processor import DicomProcessor
+from thakaamed_dicom.engine.statistics import ProcessingStatistics
+from thakaamed_dicom.reports.generator import ReportGenerator
+from thakaamed_dicom.reports.models import ReportFormat
+
+
+def anonymize_directory(
+    input_dir: Path,
+    output_dir: Path,
+    preset: str = "sfda_safe_harbor",
+    parallel: bool = False,
+    report_formats: list[ReportFormat] | None = None,
+) -> ProcessingStatistics:
+    """Run the directory pipeline the way the anonymize command does.
+
+    Tests that only inspect output files or reports use this instead of
+    CliRunner, skipping Click context setup, argv parsing and stdout
+    capture. CLI coverage stays with the tests that assert on exit codes.
+
+    Args:
+        input_dir: Directory of DICOM files to anonymize
+        output_dir: Destination directory
+        preset: Preset name passed to the processor
+        parallel: Process files in parallel
+        report_formats: Report formats to generate (None disables reports)
+
+    Returns:
+        ProcessingStatistics from the run
+    """
+    processor = DicomProcessor.from_preset_cached(preset)
+    stats = processor.process_directory(input_dir, output_dir, parallel=parallel)
+
+    if report_formats and stats.files_successful > 0:
+        generator = ReportGenerator()
+        generator.generate(
+            stats=stats,
+            preset=processor.preset,
+            input_path=str(input_dir),
+            output_path=str(output_dir),
+            uid_mapping=processor.uid_mapper.export_mapping(),
+            report_dir=output_dir / "reports",
+            formats=report_formats,
+        )
+
+    return stats
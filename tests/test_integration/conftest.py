@@ -0,0 +1,31 @@
+"""Shared fixtures for integration tests."""
+
+import pytest
+
+from tests.fixtures.dicom_factory import DicomFactory
+
+
+@pytest.fixture(scope="session")
+def study_corpus(tmp_path_factory):
+    """Synthetic 2-series x 2-file study, generated once per session.
+
+    Tests copy this tree into their own input directory instead of
+    re-serializing fresh DICOM files per test.
+    """
+    corpus_dir = tmp_path_factory.mktemp("corpus") / "study"
+    return DicomFactory.create_study_series(
+        corpus_dir,
+        num_series=2,
+        files_per_series=2,
+    )
+
+
+@pytest.fixture(scope="session")
+def study_corpus_small(tmp_path_factory):
+    """Synthetic single-series, 2-file study, generated once per session."""
+    corpus_dir = tmp_path_factory.mktemp("corpus_small") / "study"
+    return DicomFactory.create_study_series(
+        corpus_dir,
+        num_series=1,
+        files_per_series=2,
+    )
@@ -1,12 +1,27 @@
 """Test fixtures for report tests."""
 
 from datetime import datetime
+from io import BytesIO
 
 import pytest
 
 from thakaamed_dicom.reports.models import FileRecord, ReportData
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_reportlab():
+    """Force ReportLab font registration before the first timed test.
+
+    The font registry lazy-loads metrics on first draw; a throwaway
+    in-memory canvas pays that one-time cost during session setup.
+    """
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(BytesIO())
+    c.drawString(0, 0, "x")
+    c.save()
+
+
 @pytest.fixture
 def sample_file_records():
     """Sample file records for testing."""
@@ -1,6 +1,7 @@
 """Tests for CSV report builder."""
 
 import csv
+import gzip
 
 from thakaamed_dicom.reports.csv_report import CSVReportBuilder
 
@@ -99,6 +100,19 @@ class TestCSVReportBuilder:
         # UTF-8 BOM is EF BB BF
         assert first_bytes == b"\xef\xbb\xbf"
 
+    def test_build_gzip_compression(self, sample_report_data, tmp_report_dir):
+        """Gzip mode writes a .csv.gz with the same content."""
+        builder = CSVReportBuilder()
+        output_path = tmp_report_dir / "test_report.csv"
+
+        result = builder.build(sample_report_data, output_path, compression="gzip")
+
+        assert result.name == "test_report.csv.gz"
+        assert result.exists()
+
+        content = gzip.decompress(result.read_bytes()).decode("utf-8-sig")
+        assert "DICOM ANONYMIZATION REPORT" in content
+
     def test_build_status_column(self, sample_report_data, tmp_report_dir):
         """CSV shows success/failed status correctly."""
         builder = CSVReportBuilder()